@@ -0,0 +1 @@
+"""Tests for the html_extractor package."""
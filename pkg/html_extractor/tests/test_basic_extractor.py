@@ -0,0 +1,77 @@
+"""
+Unit tests for the browserless extraction path.
+
+process_with_basic and save_extraction_data need no browser, so these
+run anywhere lxml and BeautifulSoup are installed.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from runner import ExtractionData, HTMLExtractor
+
+SAMPLE_HTML = (
+  "<html><head><title>Sample</title></head><body>"
+  "<h1>One</h1><h2>Two</h2>"
+  "<p>First</p><p>Second</p><p>Third</p>"
+  '<a href="https://example.com/">link</a>'
+  '<img src="x.png">'
+  "<table><tr><td>cell</td></tr></table>"
+  "</body></html>"
+)
+
+
+class ProcessWithBasicTest(unittest.TestCase):
+  """Unit tests for the single-pass counting and tag-splicing logic."""
+
+  def setUp(self):
+    self.extractor = HTMLExtractor()
+
+  def test_counts_and_title(self):
+    _, data = self.extractor.process_with_basic(SAMPLE_HTML)
+    self.assertEqual(data.title, "Sample")
+    self.assertEqual(data.headings, 2)
+    self.assertEqual(data.paragraphs, 3)
+    self.assertEqual(data.links, 1)
+    self.assertEqual(data.images, 1)
+    self.assertEqual(data.tables, 1)
+    self.assertTrue(data.enhancementApplied)
+
+  def test_data_tag_is_spliced_before_the_last_body_close(self):
+    decoy = '<script>var x = "</body>";</script>'
+    html = f"<html><body>{decoy}<p>text</p></body></html>"
+    enhanced, _ = self.extractor.process_with_basic(html)
+    # The data tag must land after the decoy closer inside the script
+    # string, immediately before the real closing tag
+    self.assertGreater(enhanced.rindex('id="html-extractor-data"'), enhanced.index(decoy))
+    self.assertTrue(enhanced.endswith("</body></html>"))
+
+  def test_falls_back_to_soup_without_body_close(self):
+    enhanced, data = self.extractor.process_with_basic("<p>no closing body tag</p>")
+    self.assertIn('id="html-extractor-data"', enhanced)
+    self.assertEqual(data.paragraphs, 1)
+
+  def test_save_extraction_data_round_trips(self):
+    data = ExtractionData(title="T", headings=1, enhancementApplied=True)
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, "nested", "data.json")
+      self.extractor.save_extraction_data(data, path)
+      with open(path, "r", encoding="utf-8") as f:
+        loaded = json.load(f)
+    self.assertEqual(loaded, data.to_dict())
+
+  def test_extract_and_enhance_basic_saves_both_outputs(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      out_html = os.path.join(tmp, "out.html")
+      out_data = os.path.join(tmp, "out.json")
+      data = self.extractor.extract_and_enhance_basic(SAMPLE_HTML, out_html, out_data)
+      with open(out_html, "r", encoding="utf-8") as f:
+        self.assertIn('id="html-extractor-data"', f.read())
+      with open(out_data, "r", encoding="utf-8") as f:
+        self.assertEqual(json.load(f), data.to_dict())
+
+
+if __name__ == "__main__":
+  unittest.main()
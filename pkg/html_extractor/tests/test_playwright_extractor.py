@@ -0,0 +1,91 @@
+"""
+Smoke tests for the Playwright-backed extraction paths.
+
+These drive a real headless Chromium and assert that the injector's
+annotations actually land in the output — the one observable effect the
+tool exists to produce. Requires `playwright install chromium`.
+"""
+
+import os
+import tempfile
+import unittest
+
+from runner import HTMLExtractor
+
+# A minimal page with one addEventListener target and one href so both
+# annotation branches of the injector are exercised
+PAGE_WITH_LISTENERS = """<!DOCTYPE html>
+<html>
+<head><title>Smoke</title></head>
+<body>
+  <button id="btn">Click</button>
+  <a href="https://example.com/">Example</a>
+  <script>
+    document.getElementById('btn').addEventListener('click', function () {});
+  </script>
+</body>
+</html>
+"""
+
+
+class PlaywrightSmokeTest(unittest.TestCase):
+  """End-to-end checks that enhanced output carries the injector's annotations."""
+
+  def test_inline_source_is_annotated(self):
+    with HTMLExtractor() as extractor:
+      enhanced = extractor.process_html(PAGE_WITH_LISTENERS)
+    self.assertIn(b'data-node-type="event"', enhanced)
+    self.assertIn(b'data-node-type="link"', enhanced)
+    self.assertIn(b'data-node-id="node-', enhanced)
+
+  def test_file_source_is_annotated(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      source = os.path.join(tmp, "page.html")
+      with open(source, "w", encoding="utf-8") as f:
+        f.write(PAGE_WITH_LISTENERS)
+      output = os.path.join(tmp, "out", "page.html")
+      with HTMLExtractor() as extractor:
+        extractor.extract_and_enhance(source, output)
+      with open(output, "rb") as f:
+        enhanced = f.read()
+    self.assertIn(b'data-node-type="event"', enhanced)
+    self.assertIn(b'data-node-type="link"', enhanced)
+
+
+class BatchExtractionTest(unittest.TestCase):
+  """Tests for the concurrent batch path (extract_and_enhance_batch)."""
+
+  def test_mixed_file_and_inline_sources(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      file_source = os.path.join(tmp, "page.html")
+      with open(file_source, "w", encoding="utf-8") as f:
+        f.write(PAGE_WITH_LISTENERS)
+      out_file = os.path.join(tmp, "out", "from_file.html")
+      out_inline = os.path.join(tmp, "out", "from_inline.html")
+      with HTMLExtractor() as extractor:
+        extractor.extract_and_enhance_batch([
+          (file_source, out_file),
+          (PAGE_WITH_LISTENERS, out_inline),
+        ])
+      for path in (out_file, out_inline):
+        with open(path, "rb") as f:
+          self.assertIn(b'data-node-type="event"', f.read())
+
+  def test_one_failing_source_does_not_abort_the_batch(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      good_out = os.path.join(tmp, "good.html")
+      bad_out = os.path.join(tmp, "bad.html")
+      with HTMLExtractor(nav_timeout=5000) as extractor:
+        # Port 9 (discard) refuses the connection, so this source fails
+        # fast while the inline source should still be processed
+        with self.assertRaises(Exception):
+          extractor.extract_and_enhance_batch([
+            ("http://127.0.0.1:9/", bad_out),
+            (PAGE_WITH_LISTENERS, good_out),
+          ])
+      self.assertTrue(os.path.exists(good_out))
+      self.assertFalse(os.path.exists(bad_out))
+
+
+if __name__ == "__main__":
+  unittest.main()